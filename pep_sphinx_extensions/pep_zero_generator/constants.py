@@ -23,6 +23,10 @@ SPECIAL_STATUSES = {
 HIDE_STATUS = {STATUS_DRAFT}
 # Dead PEP statuses
 DEAD_STATUSES = {STATUS_REJECTED, STATUS_WITHDRAWN, STATUS_SUPERSEDED}
+# Accepted and Active PEPs are listed together
+ACCEPTED_STATUSES = {STATUS_ACCEPTED, STATUS_ACTIVE}
+# Superseded Process PEPs are historical rather than dead
+DEAD_PROCESS_STATUSES = {STATUS_REJECTED, STATUS_WITHDRAWN}
 
 TYPE_INFO = "Informational"
 TYPE_PROCESS = "Process"
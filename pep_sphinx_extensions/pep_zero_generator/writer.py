@@ -2,21 +2,21 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 import unicodedata
 
 from pep_sphinx_extensions.pep_processor.transforms.pep_headers import ABBREVIATED_STATUSES
 from pep_sphinx_extensions.pep_processor.transforms.pep_headers import ABBREVIATED_TYPES
+from pep_sphinx_extensions.pep_zero_generator.constants import ACCEPTED_STATUSES
+from pep_sphinx_extensions.pep_zero_generator.constants import DEAD_PROCESS_STATUSES
 from pep_sphinx_extensions.pep_zero_generator.constants import DEAD_STATUSES
-from pep_sphinx_extensions.pep_zero_generator.constants import STATUS_ACCEPTED
 from pep_sphinx_extensions.pep_zero_generator.constants import STATUS_ACTIVE
 from pep_sphinx_extensions.pep_zero_generator.constants import STATUS_DEFERRED
 from pep_sphinx_extensions.pep_zero_generator.constants import STATUS_DRAFT
 from pep_sphinx_extensions.pep_zero_generator.constants import STATUS_FINAL
 from pep_sphinx_extensions.pep_zero_generator.constants import STATUS_PROVISIONAL
-from pep_sphinx_extensions.pep_zero_generator.constants import STATUS_REJECTED
 from pep_sphinx_extensions.pep_zero_generator.constants import STATUS_VALUES
-from pep_sphinx_extensions.pep_zero_generator.constants import STATUS_WITHDRAWN
 from pep_sphinx_extensions.pep_zero_generator.constants import SUBINDICES_BY_TOPIC
 from pep_sphinx_extensions.pep_zero_generator.constants import TYPE_INFO
 from pep_sphinx_extensions.pep_zero_generator.constants import TYPE_PROCESS
@@ -44,6 +44,18 @@ by the PEP editors, and once assigned are never changed.  The
 the PEP texts represent their historical record.
 """
 
+PEP_TYPES_KEY = tuple(
+    f"* **{type_[0]}** --- *{type_}*: {ABBREVIATED_TYPES[type_]}"
+    for type_ in sorted(TYPE_VALUES)
+)
+
+# Draft PEPs have no status displayed, Active shares a key with Accepted
+PEP_STATUS_KEY = tuple(
+    f"* **{'<No letter>' if status == STATUS_DRAFT else status[0]}** --- "
+    f"*{status}*: {ABBREVIATED_STATUSES[status]}"
+    for status in sorted(STATUS_VALUES)
+)
+
 
 class PEPZeroWriter:
     # This is a list of reserved PEP numbers.  Reservations are not to be used for
@@ -104,15 +116,13 @@ class PEPZeroWriter:
             self.emit_text("     - ")  # for Python-Version
 
     def emit_title(self, text: str, *, symbol: str = "=") -> None:
-        self.output.append(text)
-        self.output.append(symbol * len(text))
-        self.emit_newline()
+        self.output.append(f"{text}\n{symbol * len(text)}\n")
 
     def emit_subtitle(self, text: str) -> None:
         self.emit_title(text, symbol="-")
 
     def emit_table(self, peps: list[PEP]) -> None:
-        include_version = any(pep.details["python_version"] for pep in peps)
+        include_version = any(pep.python_version for pep in peps)
         self.emit_column_headers(include_version=include_version)
         for pep in peps:
             details = pep.details
@@ -226,10 +236,8 @@ class PEPZeroWriter:
 
         # PEP types key
         self.emit_title("PEP Types Key")
-        for type_ in sorted(TYPE_VALUES):
-            self.emit_text(
-                f"* **{type_[0]}** --- *{type_}*: {ABBREVIATED_TYPES[type_]}"
-            )
+        for type_key in PEP_TYPES_KEY:
+            self.emit_text(type_key)
             self.emit_newline()
 
         self.emit_text(":pep:`More info in PEP 1 <1#pep-types>`.")
@@ -237,12 +245,8 @@ class PEPZeroWriter:
 
         # PEP status key
         self.emit_title("PEP Status Key")
-        for status in sorted(STATUS_VALUES):
-            # Draft PEPs have no status displayed, Active shares a key with Accepted
-            status_code = "<No letter>" if status == STATUS_DRAFT else status[0]
-            self.emit_text(
-                f"* **{status_code}** --- *{status}*: {ABBREVIATED_STATUSES[status]}"
-            )
+        for status_key in PEP_STATUS_KEY:
+            self.emit_text(status_key)
             self.emit_newline()
 
         self.emit_text(":pep:`More info in PEP 1 <1#pep-review-resolution>`.")
@@ -250,8 +254,7 @@ class PEPZeroWriter:
 
         if is_pep0:
             # PEP owners
-            authors_dict = _verify_email_addresses(peps)
-            max_name_len = max(len(author_name) for author_name in authors_dict)
+            authors_dict, max_name_len = _verify_email_addresses(peps)
             self.emit_title("Authors/Owners")
             self.emit_author_table_separator(max_name_len)
             self.emit_text(f"{'Name':{max_name_len}}  Email Address")
@@ -264,8 +267,7 @@ class PEPZeroWriter:
             self.emit_newline()
             self.emit_newline()
 
-        pep0_string = "\n".join(map(str, self.output))
-        return pep0_string
+        return "\n".join(self.output)
 
 
 def _classify_peps(peps: list[PEP]) -> tuple[list[PEP], ...]:
@@ -288,9 +290,9 @@ def _classify_peps(peps: list[PEP]) -> tuple[list[PEP], ...]:
         elif pep.status == STATUS_DEFERRED:
             deferred.append(pep)
         elif pep.pep_type == TYPE_PROCESS:
-            if pep.status in {STATUS_ACCEPTED, STATUS_ACTIVE}:
+            if pep.status in ACCEPTED_STATUSES:
                 meta.append(pep)
-            elif pep.status in {STATUS_WITHDRAWN, STATUS_REJECTED}:
+            elif pep.status in DEAD_PROCESS_STATUSES:
                 dead.append(pep)
             else:
                 historical.append(pep)
@@ -306,7 +308,7 @@ def _classify_peps(peps: list[PEP]) -> tuple[list[PEP], ...]:
                 historical.append(pep)
         elif pep.status == STATUS_PROVISIONAL:
             provisional.append(pep)
-        elif pep.status in {STATUS_ACCEPTED, STATUS_ACTIVE}:
+        elif pep.status in ACCEPTED_STATUSES:
             accepted.append(pep)
         elif pep.status == STATUS_FINAL:
             finished.append(pep)
@@ -315,43 +317,47 @@ def _classify_peps(peps: list[PEP]) -> tuple[list[PEP], ...]:
     return meta, info, provisional, accepted, open_, finished, historical, deferred, dead
 
 
-def _verify_email_addresses(peps: list[PEP]) -> dict[str, str]:
-    authors_dict: dict[str, set[str]] = {}
+def _verify_email_addresses(peps: list[PEP]) -> tuple[dict[str, str], int]:
+    """Return each author's email address and the length of the longest name."""
+    authors_dict: dict[str, str] = {}
+    too_many_emails: dict[str, set[str]] = {}
+    max_name_len = 0
     for pep in peps:
         for author in pep.authors:
             # If this is the first time we have come across an author, add them.
             if author.full_name not in authors_dict:
-                authors_dict[author.full_name] = set()
+                authors_dict[author.full_name] = author.email
+                max_name_len = max(max_name_len, len(author.full_name))
+                continue
 
-            # If the new email is an empty string, move on.
-            if not author.email:
+            # If the new email is an empty string or already known, move on.
+            known_email = authors_dict[author.full_name]
+            if not author.email or author.email == known_email:
                 continue
-            # If the email has not been seen, add it to the list.
-            authors_dict[author.full_name].add(author.email)
-
-    valid_authors_dict: dict[str, str] = {}
-    too_many_emails: list[tuple[str, set[str]]] = []
-    for full_name, emails in authors_dict.items():
-        if len(emails) > 1:
-            too_many_emails.append((full_name, emails))
-        else:
-            valid_authors_dict[full_name] = next(iter(emails), "")
+            # If no email has been seen yet, record this one.
+            if not known_email:
+                authors_dict[author.full_name] = author.email
+                continue
+            # Otherwise the author has conflicting emails.
+            too_many_emails.setdefault(author.full_name, {known_email}).add(author.email)
+
     if too_many_emails:
         err_output = []
-        for author, emails in too_many_emails:
+        for author, emails in too_many_emails.items():
             err_output.append(" " * 4 + f"{author}: {emails}")
         raise ValueError(
             "some authors have more than one email address listed:\n"
             + "\n".join(err_output)
         )
 
-    return valid_authors_dict
+    return authors_dict, max_name_len
 
 
 def _sort_authors(authors_dict: dict[str, str]) -> list[str]:
     return sorted(authors_dict, key=_author_sort_by)
 
 
+@functools.lru_cache(maxsize=None)
 def _author_sort_by(author_name: str) -> str:
     """Skip lower-cased words in surname when sorting."""
     surname, *_ = author_name.split(",")
@@ -359,6 +365,11 @@ def _author_sort_by(author_name: str) -> str:
     for i, part in enumerate(surname_parts):
         if part[0].isupper():
             base = " ".join(surname_parts[i:]).lower()
-            return unicodedata.normalize("NFKD", base)
-    # If no capitals, use the whole string
-    return unicodedata.normalize("NFKD", surname.lower())
+            break
+    else:
+        # If no capitals, use the whole string
+        base = surname.lower()
+    # NFKD normalisation is a no-op for ASCII names
+    if base.isascii():
+        return base
+    return unicodedata.normalize("NFKD", base)
@@ -1,4 +1,5 @@
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -20,12 +21,8 @@ def test_pep_zero_writer_emit_title():
     pep0_writer.emit_subtitle("My Subtitle")
 
     assert pep0_writer.output == [
-        "My Title",
-        "========",
-        "",
-        "My Subtitle",
-        "-----------",
-        "",
+        "My Title\n========\n",
+        "My Subtitle\n-----------\n",
     ]
 
 
@@ -50,10 +47,80 @@ def test_verify_email_addresses(test_input, expected):
     peps = [parser.PEP(Path(f"pep_sphinx_extensions/tests/peps/{test_input}"))]
 
     # Act
-    out = writer._verify_email_addresses(peps)
+    out, max_name_len = writer._verify_email_addresses(peps)
 
     # Assert
     assert out == expected
+    assert max_name_len == len("Javier Soulfulcommodore")
+
+
+@pytest.mark.parametrize(
+    ("authors", "expected"),
+    [
+        (
+            [
+                parser._Author("Ann Short", "ann@example.com"),
+                parser._Author("Ann Short", ""),
+                parser._Author("Bartholomew Longername", "bart@example.com"),
+            ],
+            len("Bartholomew Longername"),
+        ),
+        ([], 0),
+    ],
+)
+def test_verify_email_addresses_max_name_len(authors, expected):
+    # Arrange
+    peps = [SimpleNamespace(authors=authors)]
+
+    # Act
+    _, max_name_len = writer._verify_email_addresses(peps)
+
+    # Assert
+    assert max_name_len == expected
+
+
+def test_verify_email_addresses_conflict():
+    # Arrange
+    pep = parser.PEP(Path("pep_sphinx_extensions/tests/peps/pep-9000.rst"))
+    other = SimpleNamespace(
+        authors=[
+            parser._Author("Francis Fussyreverend", ""),
+            parser._Author("Francis Fussyreverend", "three@example.com"),
+        ]
+    )
+    peps = [pep, other]
+
+    # Act
+    with pytest.raises(ValueError, match="more than one email address") as exc_info:
+        writer._verify_email_addresses(peps)
+
+    # Assert
+    message = str(exc_info.value)
+    assert "Francis Fussyreverend" in message
+    assert "one@example.com" in message
+    assert "three@example.com" in message
+    assert "Javier Soulfulcommodore" not in message
+
+
+def test_verify_email_addresses_repeated_email():
+    # Arrange
+    pep = parser.PEP(Path("pep_sphinx_extensions/tests/peps/pep-9000.rst"))
+    other = SimpleNamespace(
+        authors=[
+            parser._Author("Francis Fussyreverend", "one@example.com"),
+            parser._Author("Javier Soulfulcommodore", ""),
+        ]
+    )
+    peps = [pep, other]
+
+    # Act
+    out, _ = writer._verify_email_addresses(peps)
+
+    # Assert
+    assert out == {
+        "Francis Fussyreverend": "one@example.com",
+        "Javier Soulfulcommodore": "two@example.com",
+    }
 
 
 def test_sort_authors():